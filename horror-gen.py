@@ -3,127 +3,217 @@
 Horror Movie Quote Video Generator
 A Python application to create YouTube Shorts from horror movie quotes
 """
+# The generator is deliberately a single runnable script, so it outgrows pylint's
+# 1000-line module limit rather than being split into an importable package
+# pylint: disable=too-many-lines
 
 import os
 import sys
 import json
+import logging
+import hashlib
 import random
+import time
 import argparse
 import asyncio
-import tempfile
 import subprocess
+import tempfile
 import re
-import shutil
+import sqlite3
+import mmap
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import closing
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 
 # Required external libraries
 import openai
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from dotenv import load_dotenv
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaIoBaseUpload
 from googleapiclient.errors import HttpError
+import httplib2
 
 # Load environment variables
 load_dotenv()
 
+# Progress goes through logging so noisy per-frame detail can be turned down
+# (set HORRORVIBES_LOG=DEBUG for everything, WARNING for problems only)
+_log_level = getattr(logging, os.getenv("HORRORVIBES_LOG", "INFO").upper(), None)
+logging.basicConfig(level=_log_level if isinstance(_log_level, int) else logging.INFO,
+                    format="%(message)s", stream=sys.stdout)
+log = logging.getLogger("horrorvibes")
+
 # Set up OpenAI client
 openai_api_key = os.getenv("OPENAI_API_KEY")
 
+# Chat model used for quote generation (must support JSON response mode)
+QUOTE_MODEL = "gpt-4o"
+
+# Horror sub-genres the quote requests are spread across
+QUOTE_THEMES = ["classic horror", "modern horror", "psychological horror",
+                "slasher films", "supernatural horror", "zombie films",
+                "vampire movies", "ghost stories"]
+
 # Configure dimensions for YouTube Shorts (9:16 aspect ratio)
 WIDTH = 1080
 HEIGHT = 1920
 
-# Directory setup
-QUOTES_DIR = Path("./quotes")
-IMAGES_DIR = Path("./images")
-FRAMES_DIR = Path("./frames")
-OUTPUT_DIR = Path("./output")
-AUDIO_DIR = Path("./audio")  # New directory for your custom audio files
-
+# Text sizes: very large quotes, large movie title
+QUOTE_FONT_SIZE = 60
+MOVIE_FONT_SIZE = 48
+
+# Background gradients, from one dark color to another
+# Use a different color combination for each image to add variety
+COLOR_PAIRS = [
+    ((120, 0, 0), (40, 0, 0)),     # Dark red gradient (brighter)
+    ((0, 0, 120), (0, 0, 40)),     # Dark blue gradient (brighter)
+    ((80, 0, 100), (30, 0, 40)),   # Dark purple gradient (brighter)
+    ((0, 80, 80), (0, 30, 30)),    # Dark teal gradient (brighter)
+    ((100, 80, 0), (40, 30, 0)),   # Dark amber gradient (brighter)
+    ((80, 80, 80), (30, 30, 30)),  # Dark gray gradient (brighter)
+    ((0, 100, 0), (0, 40, 0)),     # Dark green gradient (brighter)
+    ((100, 0, 100), (40, 0, 40)),  # Dark magenta gradient (brighter)
+    ((100, 50, 0), (40, 20, 0))    # Dark orange gradient (brighter)
+]
+
+# YouTube resumable uploads: large chunks amortize the per-request round trip
+UPLOAD_CHUNK_ALIGN = 256 * 1024  # Chunk sizes must be a multiple of 256 KB
+UPLOAD_CHUNK_SIZE = 50 * 1024 * 1024
+UPLOAD_RETRY_STATUSES = (408, 500, 502, 503, 504)  # Transient errors worth retrying a chunk for
+UPLOAD_MAX_RETRIES = 10
+UPLOAD_MAX_BACKOFF = 32  # Seconds
+UPLOAD_PROGRESS_INTERVAL = 1.0  # Minimum seconds between upload progress lines
+
+# H.264 encoders in order of preference, with their quality settings; hardware encoders
+# are only used when FFmpeg lists them and a test encode succeeds on this machine
+VIDEO_ENCODERS = {
+    'h264_nvenc': ['-preset', 'p1', '-cq', '23'],        # NVIDIA
+    'h264_videotoolbox': ['-b:v', '6M'],                 # macOS
+    'h264_qsv': ['-global_quality', '23'],               # Intel Quick Sync
+    'libx264': ['-preset', 'ultrafast',                  # Stills, so motion search is wasted work
+                '-tune', 'stillimage', '-crf', '23'],
+}
+
+# Directory setup: the working directory, resolved once at startup so later file
+# checks use absolute paths instead of re-resolving the cwd every time
+BASE_DIR = Path.cwd().resolve()
+QUOTES_DIR = BASE_DIR / "quotes"
+IMAGES_DIR = BASE_DIR / "images"
+OUTPUT_DIR = BASE_DIR / "output"
+AUDIO_DIR = BASE_DIR / "audio"  # New directory for your custom audio files
+
+# Create the project directories once, when the script starts
+for _directory in (QUOTES_DIR, IMAGES_DIR, OUTPUT_DIR, AUDIO_DIR):
+    _directory.mkdir(exist_ok=True, parents=True)
+
+# Custom audio formats, and the cached validation results for files in AUDIO_DIR
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a')
+AUDIO_MANIFEST = AUDIO_DIR / ".manifest.json"
+
+# Quote history used to prevent repeats across runs
+QUOTE_HISTORY_DB = BASE_DIR / "quotes_history.db"
+QUOTE_HISTORY_FILE = BASE_DIR / "quotes_history.txt"  # Legacy plain text history
+
+# Last quote set per request, reused only when --reuse-quotes is passed
+QUOTE_CACHE_FILE = OUTPUT_DIR / ".quote_cache.json"
+
+# Precompiled text helpers used per quote
+_LEADING_NUMBER = re.compile(r'^\d+[.)]\s*')  # e.g. "1. " or "1) "
+_QUOTE_MARKS = str.maketrans('', '', '"\'')
+
+
+def _normalize_quote(quote: str) -> str:
+    """Normalize a quote to catch slight variations when checking for duplicates"""
+    return quote.lower().translate(_QUOTE_MARKS).strip()
+
+
+def _open_quote_history() -> sqlite3.Connection:
+    """
+    Open the quote history database, importing the legacy text history if present
 
-def setup_directories() -> None:
-    """Create necessary project directories and clean up quotes from previous runs"""
-    for directory in [QUOTES_DIR, IMAGES_DIR, FRAMES_DIR, OUTPUT_DIR, AUDIO_DIR]:
-        directory.mkdir(exist_ok=True, parents=True)
+    Returns:
+        Connection to the history database
+    """
+    conn = sqlite3.connect(QUOTE_HISTORY_DB)
+    with conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS quotes (norm TEXT PRIMARY KEY, raw TEXT)")
 
-    # Clean up old quote files to ensure fresh quotes each run
-    for quote_file in QUOTES_DIR.glob("quote_*.txt"):
-        quote_file.unlink()
-        print(f"Removed old quote file: {quote_file}")
+        # Carry over quotes recorded by older versions in the plain text history
+        if QUOTE_HISTORY_FILE.exists():
+            with open(QUOTE_HISTORY_FILE, 'r', encoding='utf-8') as f:
+                legacy = [line.strip() for line in f if line.strip()]
+            conn.executemany("INSERT OR IGNORE INTO quotes (norm, raw) VALUES (?, ?)",
+                             [(_normalize_quote(quote), quote) for quote in legacy])
+            QUOTE_HISTORY_FILE.rename(QUOTE_HISTORY_FILE.with_suffix('.txt.imported'))
+            log.info("Imported %s quotes from %s", len(legacy), QUOTE_HISTORY_FILE)
 
-    print("✓ Project directories created and cleaned")
+    return conn
 
 
-def get_horror_movie_quotes(count: int = 9) -> List[str]:
+def _format_quote(entry: dict) -> str:
     """
-    Get horror movie quotes from ChatGPT with robust duplicate prevention
+    Format a structured quote from the JSON response as 'QUOTE' - MOVIE TITLE (YEAR)
 
     Args:
-        count: Number of quotes to retrieve
+        entry: Quote object with text, movie and year keys
 
     Returns:
-        List of horror movie quotes with movie titles
+        Quote string in the format used by the rest of the pipeline
     """
-    print(f"Requesting {count} horror movie quotes from ChatGPT...")
+    text = str(entry.get("text", "")).strip()
+    movie = str(entry.get("movie", "")).strip() or "Unknown"
+    year = str(entry.get("year", "")).strip()
+    return f'"{text}" - {movie} ({year})' if year else f'"{text}" - {movie}'
 
-    # Check if we have a quotes history file
-    history_file = Path("./quotes_history.txt")
-    used_quotes = set()
-    if history_file.exists():
-        with open(history_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    # Normalize the quote to catch slight variations
-                    normalized = line.lower().replace('"', '').replace("'", "").strip()
-                    used_quotes.add(normalized)
 
-    print(f"Found {len(used_quotes)} previously used quotes")
-
-    # We'll make multiple attempts to get unique quotes
-    max_attempts = 5
-    all_new_quotes = []
-
-    for attempt in range(max_attempts):
-        if len(all_new_quotes) >= count:
-            break
-
-        print(f"Attempt {attempt + 1} to get unique quotes...")
+async def _request_quotes(client: openai.AsyncOpenAI, count: int, themes: List[str],
+                          max_retries: int = 3) -> List[str]:
+    """
+    Request a batch of horror movie quotes as JSON in one call, retrying with backoff
 
-        # Generate a random seed and timestamp to avoid caching
-        random_seed = random.randint(1, 100000)
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+    Args:
+        client: Shared async OpenAI client
+        count: Number of quotes to request
+        themes: Horror sub-genres to spread the quotes across
+        max_retries: Number of attempts before giving up
 
-        # Create a more specific prompt for variety
-        themes = ["classic horror", "modern horror", "psychological horror",
-                  "slasher films", "supernatural horror", "zombie films",
-                  "vampire movies", "ghost stories"]
-        selected_theme = random.choice(themes)
+    Returns:
+        Formatted quotes from the response (empty if every attempt failed)
+    """
+    # Generate a random seed and timestamp to avoid caching
+    random_seed = random.randint(1, 100000)
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
 
+    backoff = 1
+    for attempt in range(max_retries):
         try:
-            client = openai.OpenAI(api_key=openai_api_key)
-            response = client.chat.completions.create(
-                model="gpt-4",
+            response = await client.chat.completions.create(
+                model=QUOTE_MODEL,
+                response_format={"type": "json_object"},
                 messages=[
                     {
                         "role": "system",
                         "content": ("You are a film historian specializing in horror movies. "
                                     "Provide authentic, memorable quotes from horror films. "
-                                    "Include only the quote and the movie title. "
-                                    "Format as: 'QUOTE' - MOVIE TITLE (YEAR). "
+                                    "Respond with JSON only, in the form "
+                                    '{"quotes": [{"text": "...", "movie": "...", "year": 1980}]}. '
                                     "Ensure each quote is unique and different from any "
                                     "you've provided before.")
                     },
                     {
                         "role": "user",
-                        "content": (f"Provide {count - len(all_new_quotes)} different, "
-                                    f"authentic horror movie quotes focusing on {selected_theme}. "
+                        "content": (f"Return {count} different, "
+                                    f"authentic horror movie quotes as JSON, spread across "
+                                    f"{', '.join(themes)}. "
                                     f"Choose quotes that are impactful, memorable, and would "
                                     f"look good on a dramatic background. Random seed: {random_seed}, "
                                     f"timestamp: {timestamp}. Make sure these are completely "
@@ -135,331 +225,584 @@ def get_horror_movie_quotes(count: int = 9) -> List[str]:
                 top_p=0.9,
             )
 
-            # Extract quotes from response
-            content = response.choices[0].message.content
-            quote_lines = [line.strip() for line in content.split('\n') if line.strip()]
+            # Extract quotes from the JSON response
+            content = json.loads(response.choices[0].message.content)
+            return [_format_quote(entry) for entry in content.get("quotes", [])
+                    if isinstance(entry, dict) and entry.get("text")]
+
+        except Exception as e:
+            log.warning("Error requesting quotes (attempt %s): %s", attempt + 1, e)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff)
+                backoff *= 2
+
+    return []
+
+
+def _quote_cache_key(count: int) -> str:
+    """Hash the parameters that shape a quote request into a cache key"""
+    params = json.dumps([count, QUOTE_MODEL, QUOTE_THEMES])
+    return hashlib.blake2b(params.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _load_quote_cache() -> dict:
+    """Load the quote cache, treating a missing or unreadable file as empty"""
+    try:
+        with open(QUOTE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_quote_files(quotes: List[str]) -> None:
+    """Write each quote to its own numbered file in the quotes directory"""
+    # Clean up old quote files so only this run's quotes remain
+    for quote_file in QUOTES_DIR.glob("quote_*.txt"):
+        quote_file.unlink()
+        log.debug("Removed old quote file: %s", quote_file)
+
+    for i, quote in enumerate(quotes):
+        with open(QUOTES_DIR / f"quote_{i + 1}.txt", "w", encoding='utf-8') as f:
+            f.write(quote)
+
+
+async def get_horror_movie_quotes(count: int = 9,
+                                  client: Optional[openai.AsyncOpenAI] = None,
+                                  reuse: bool = False) -> List[str]:
+    """
+    Get horror movie quotes from ChatGPT with robust duplicate prevention
+
+    Args:
+        count: Number of quotes to retrieve
+        client: Shared async OpenAI client; a temporary one is created if omitted
+        reuse: Return the last set cached for these parameters instead of requesting
+            new quotes (for re-rendering the same video)
+
+    Returns:
+        List of horror movie quotes with movie titles
+    """
+    # Only a deliberate re-render reuses the last set; normal runs always get new quotes
+    cache_key = _quote_cache_key(count)
+    quote_cache = _load_quote_cache()
+    cached = quote_cache.get(cache_key)
+    if reuse:
+        if isinstance(cached, list) and len(cached) == count:
+            _save_quote_files(cached)
+            log.info("✓ Reusing %s quotes from the last run", len(cached))
+            return cached
+        log.info("No cached quote set for %s quotes, requesting new ones", count)
+
+    if client is None:
+        async with openai.AsyncOpenAI(api_key=openai_api_key) as own_client:
+            return await get_horror_movie_quotes(count, client=own_client)
+
+    log.info("Requesting %s horror movie quotes from ChatGPT...", count)
+
+    # Previously used quotes live in an indexed SQLite table, queried on demand
+    with closing(_open_quote_history()) as history:
+        used_count = history.execute("SELECT COUNT(*) FROM quotes").fetchone()[0]
+        log.info("Found %s previously used quotes", used_count)
+
+        all_new_quotes = []
+        seen_quotes = set()
+        # Ask for extra quotes in a single request so duplicates can be dropped locally,
+        # then make at most one top-up request if too many turned out to be repeats
+        for batch in range(2):
+            needed = count - len(all_new_quotes)
+            if needed <= 0:
+                break
+
+            request_count = needed * 2
+            if batch == 0:
+                log.info("Requesting %s quotes in a single batch...", request_count)
+            else:
+                log.info("Only %s unique quotes so far, requesting %s more...",
+                         len(all_new_quotes), request_count)
+            quote_lines = await _request_quotes(client, request_count, QUOTE_THEMES)
 
             # Check each quote for uniqueness
-            for quote in quote_lines:
+            for quote in quote_lines[:request_count]:
                 if len(all_new_quotes) >= count:
                     break
 
                 # Normalize for comparison
-                normalized = quote.lower().replace('"', '').replace("'", "").strip()
+                normalized = _normalize_quote(quote)
 
                 # Check if this quote is unique
-                if normalized not in used_quotes:
+                used = history.execute("SELECT 1 FROM quotes WHERE norm = ?", (normalized,)).fetchone()
+                if not used and normalized not in seen_quotes:
                     all_new_quotes.append(quote)
-                    used_quotes.add(normalized)
-                    print(f"  ✓ Added unique quote: {quote[:50]}...")
+                    seen_quotes.add(normalized)
+                    log.debug("  ✓ Added unique quote: %s...", quote[:50])
                 else:
-                    print(f"  × Skipped duplicate: {quote[:50]}...")
+                    log.debug("  × Skipped duplicate: %s...", quote[:50])
 
-        except Exception as e:
-            print(f"Error in attempt {attempt + 1}: {e}")
-            continue
+        # Add new quotes to history (the primary key ignores duplicates)
+        with history:
+            history.executemany("INSERT OR IGNORE INTO quotes (norm, raw) VALUES (?, ?)",
+                                [(_normalize_quote(quote), quote) for quote in all_new_quotes])
 
     if len(all_new_quotes) < count:
-        print(f"Warning: Only got {len(all_new_quotes)} unique quotes out of {count} requested")
+        log.warning("Warning: Only got %s unique quotes out of %s requested", len(all_new_quotes), count)
 
     # Store quotes to files
-    for i, quote in enumerate(all_new_quotes):
-        with open(QUOTES_DIR / f"quote_{i + 1}.txt", "w", encoding='utf-8') as f:
-            f.write(quote)
+    _save_quote_files(all_new_quotes)
 
-    # Add new quotes to history file (avoiding duplicates)
-    if all_new_quotes:
-        with open(history_file, 'a', encoding='utf-8') as f:
-            for quote in all_new_quotes:
-                f.write(f"{quote}\n")
+    # Only cache complete sets so a short batch is retried next run
+    if len(all_new_quotes) == count:
+        quote_cache[cache_key] = all_new_quotes
+        try:
+            with open(QUOTE_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(quote_cache, f, indent=2)
+        except OSError as e:
+            log.warning("Could not write quote cache: %s", e)
 
-    print(f"✓ Generated {len(all_new_quotes)} unique horror movie quotes")
+    log.info("✓ Generated %s unique horror movie quotes", len(all_new_quotes))
     return all_new_quotes
 
 
-def generate_background_image(quote: str, index: int) -> Path:
+def _blotch_mask(seed: int, count: int) -> np.ndarray:
+    """
+    Rasterize random black discs into a coverage mask
+
+    Args:
+        seed: Seed for the blotch positions and sizes
+        count: Number of blotches to draw
+
+    Returns:
+        (HEIGHT, WIDTH) bool array, True where a disc covers the pixel
+    """
+    # One vectorized draw of (x, y, radius) for every blotch
+    rng = np.random.default_rng(seed)
+    xs, ys, radii = rng.integers((0, 0, 5), (WIDTH + 1, HEIGHT + 1, 101), size=(count, 3)).T
+
+    # Expand each disc into one horizontal span per row it covers
+    rows = 2 * radii + 1
+    blob = np.repeat(np.arange(count), rows)
+    dy = np.arange(rows.sum()) - np.repeat(np.cumsum(rows) - rows, rows) - radii[blob]
+    span_y = ys[blob] + dy
+    # (PIL's ellipse covers 2r + 1 pixels across, so measure to the outer pixel edge)
+    half_width = np.sqrt((radii[blob] + 0.5) ** 2 - dy ** 2).astype(np.int64)
+    x0 = np.clip(xs[blob] - half_width, 0, WIDTH)
+    x1 = np.clip(xs[blob] + half_width + 1, 0, WIDTH)
+    keep = (span_y >= 0) & (span_y < HEIGHT) & (x0 < x1)
+
+    # Mark span edges in a difference array and prefix-sum along each row; any pixel
+    # inside at least one span is covered
+    edges = np.zeros((HEIGHT, WIDTH + 1), dtype=np.int32)
+    np.add.at(edges, (span_y[keep], x0[keep]), 1)
+    np.add.at(edges, (span_y[keep], x1[keep]), -1)
+    return np.cumsum(edges[:, :WIDTH], axis=1) > 0
+
+
+@lru_cache(maxsize=len(COLOR_PAIRS))
+def _make_gradient(color1: tuple, color2: tuple) -> np.ndarray:
+    """
+    Build a vertical gradient array, cached per color pair
+
+    Args:
+        color1: RGB color at the top of the image
+        color2: RGB color at the bottom of the image
+
+    Returns:
+        Read-only (HEIGHT, WIDTH, 3) uint8 array
+    """
+    # Interpolate one color per row, then broadcast it across the full width
+    t = np.linspace(0, 1, HEIGHT, dtype=np.float32)[:, None]
+    start = np.asarray(color1, dtype=np.float32)
+    end = np.asarray(color2, dtype=np.float32)
+    rows = (start + (end - start) * t).astype(np.uint8)
+    gradient = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (HEIGHT, WIDTH, 3)))
+    gradient.flags.writeable = False
+    return gradient
+
+
+def generate_background_image(quote: str, index: int) -> np.ndarray:
     """
     Generate a creepy background image for a quote
 
     Args:
         quote: The horror movie quote
-        index: Quote index for filename
+        index: Quote index, used to pick the color scheme
 
     Returns:
-        Path to the generated image
+        (HEIGHT, WIDTH, 3) uint8 RGB array of the background
     """
-    print(f"GENERATING BACKGROUND for quote {index + 1}...")
-    print("THIS FUNCTION IS DEFINITELY RUNNING NOW")
+    log.info("Generating background for quote %s...", index + 1)
 
     try:
-        # Create a dark gradient background
-        image_path = IMAGES_DIR / f"background_{index + 1}.png"
-
-        # Create gradient from one dark color to another
-        # Use a different color combination for each image to add variety
-        color_pairs = [
-            ((120, 0, 0), (40, 0, 0)),     # Dark red gradient (brighter)
-            ((0, 0, 120), (0, 0, 40)),     # Dark blue gradient (brighter)
-            ((80, 0, 100), (30, 0, 40)),   # Dark purple gradient (brighter)
-            ((0, 80, 80), (0, 30, 30)),    # Dark teal gradient (brighter)
-            ((100, 80, 0), (40, 30, 0)),   # Dark amber gradient (brighter)
-            ((80, 80, 80), (30, 30, 30)),  # Dark gray gradient (brighter)
-            ((0, 100, 0), (0, 40, 0)),     # Dark green gradient (brighter)
-            ((100, 0, 100), (40, 0, 40)),  # Dark magenta gradient (brighter)
-            ((100, 50, 0), (40, 20, 0))    # Dark orange gradient (brighter)
-        ]
-
         # Select a color pair based on the index, cycling through options
-        color1, color2 = color_pairs[index % len(color_pairs)]
-        print(f"Using color gradient: {color1} to {color2}")
-
-        # Create a new image with the 9:16 aspect ratio
-        img = Image.new('RGB', (WIDTH, HEIGHT), color=color1)
-        draw = ImageDraw.Draw(img)
+        color1, color2 = COLOR_PAIRS[index % len(COLOR_PAIRS)]
+        log.debug("Using color gradient: %s to %s", color1, color2)
 
-        print("Drawing gradient...")
-        # Draw the gradient background
-        for y in range(HEIGHT):
-            # Calculate color for this row
-            r = int(color1[0] + (color2[0] - color1[0]) * y / HEIGHT)
-            g = int(color1[1] + (color2[1] - color1[1]) * y / HEIGHT)
-            b = int(color1[2] + (color2[2] - color1[2]) * y / HEIGHT)
+        # Texture is seeded from the quote, so identical inputs always give the same image
+        seed = int.from_bytes(hashlib.blake2b(quote.encode('utf-8'), digest_size=8).digest(), 'big')
 
-            # Draw a line with this color
-            draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
-
-        # Save the background image (before adding texture to ensure it works)
-        img.save(image_path)
-        print(f"Saved basic gradient to {image_path}")
+        log.debug("Drawing gradient...")
+        # The 9:16 gradient doubles as the fallback if texturing fails
+        background = _make_gradient(color1, color2)
 
         # Add some random dark texture elements for a creepy effect
         try:
-            print("Adding texture elements...")
-            texture_img = img.copy().convert('RGBA')
-            texture_draw = ImageDraw.Draw(texture_img)
-
-            for _ in range(100):  # Reduced number for speed
-                x = random.randint(0, WIDTH)
-                y = random.randint(0, HEIGHT)
-                size = random.randint(5, 100)
-
-                # Draw directly on the image without using a separate shape
-                texture_draw.ellipse(
-                    (x - size, y - size, x + size, y + size),
-                    fill=(0, 0, 0, random.randint(0, 50))
-                )
-
-            # Convert back to RGB and save
-            final_img = texture_img.convert('RGB')
-            final_img.save(image_path)
-            print(f"Saved textured gradient to {image_path}")
+            log.debug("Adding texture elements...")
+            # The original ellipses were drawn onto an RGBA copy, which replaces pixels
+            # outright; the alpha was then dropped, leaving opaque black discs
+            covered = _blotch_mask(seed, 100)  # Reduced number for speed
+            background = np.where(covered[..., None], np.uint8(0), background)
 
         except Exception as texture_error:
-            print(f"Error adding texture: {texture_error}, using basic gradient")
-            # The basic gradient was already saved, so we'll use that
-
-        print(f"✓ Created background image {index + 1} at {image_path}")
-        # Verify it exists
-        if os.path.exists(image_path):
-            print(f"Verified background image file exists: {image_path}")
-            # Check file size to ensure it's not empty
-            file_size = os.path.getsize(image_path)
-            print(f"Background file size: {file_size} bytes")
-            if file_size < 1000:
-                print("WARNING: Background file is suspiciously small!")
-        else:
-            print(f"WARNING: Background image file not found after saving: {image_path}")
+            log.warning("Error adding texture: %s, using basic gradient", texture_error)
 
-        return image_path
+        log.info("✓ Created background image %s", index + 1)
+        return background
 
     except Exception as e:
-        print(f"Error generating background image: {e}")
+        log.error("Error generating background image: %s", e)
         # Return a simple black background if something goes wrong
-        image_path = IMAGES_DIR / f"background_{index + 1}.png"
-        Image.new("RGB", (WIDTH, HEIGHT), color="black").save(image_path)
-        print("  Created black placeholder image instead")
-        return image_path
+        log.warning("  Created black placeholder image instead")
+        return np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
 
 
-def create_frames_with_text(background_paths: List[Path], quotes: List[str]) -> List[Path]:
+@lru_cache(maxsize=1)
+def _find_font_path() -> Optional[str]:
     """
-    Create frames with large text on gradient backgrounds
+    Find the first available bold system font
+
+    Returns:
+        Path to the font file, or None if none of the known fonts exist
+    """
+    system_fonts = [
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+        '/usr/share/fonts/truetype/ubuntu/Ubuntu-B.ttf',
+        '/Library/Fonts/Arial Bold.ttf',
+        '/Library/Fonts/Helvetica.ttc',
+        'C:\\Windows\\Fonts\\arialbd.ttf',
+        'C:\\Windows\\Fonts\\segoeui.ttf'
+    ]
+
+    for font_path in system_fonts:
+        if os.path.exists(font_path):
+            log.debug("Using system font: %s", font_path)
+            return font_path
+
+    log.info("Using default font")
+    return None
+
+
+@lru_cache(maxsize=16)
+def _load_font(path: Optional[str], size: int):
+    """
+    Load a font once per process, parsing its glyph tables only on first use
 
     Args:
-        background_paths: Paths to background images
-        quotes: List of quotes
+        path: TrueType font file, or None for PIL's default font
+        size: Font size in pixels
 
     Returns:
-        List of paths to frames with text
+        The loaded font
     """
-    print("Creating frames with large text on gradient backgrounds...")
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
 
-    frame_paths = []
-    for i, (background_path, quote) in enumerate(zip(background_paths, quotes)):
-        print(f"Creating frame {i+1}...")
-        print(f"Using background: {background_path}")
 
-        try:
-            # Split quote into quote text and movie title
-            parts = quote.split(' - ')
-            quote_text = parts[0].strip()
-            movie_title = parts[1].strip() if len(parts) > 1 else "Unknown"
-
-            # Remove leading numbers from quote (e.g., "1. " or "1) ")
-            quote_text = re.sub(r'^\d+[\.\)]\s*', '', quote_text)
-
-            # Output path for the frame
-            frame_path = FRAMES_DIR / f"frame_{i + 1}.png"
-
-            # SANITY CHECK - create a solid color background instead of using the gradient
-            # This is to see if the issue is with loading the gradient or with something else
-            bg_type = "gradient"  # "gradient" to use the gradient, "solid" to use a solid color
-
-            if bg_type == "solid":
-                # Create a solid color background (for testing)
-                colors = [(120, 0, 0), (0, 0, 120), (0, 120, 0), (120, 0, 120), (0, 120, 120)]
-                img = Image.new('RGB', (WIDTH, HEIGHT), colors[i % len(colors)])
-                print(f"Created solid color background: {colors[i % len(colors)]}")
-            else:
-                # Use the gradient background
-                try:
-                    # Check if the file exists and print debug info
-                    if not os.path.isfile(background_path):
-                        print(f"Background file not found: {background_path}")
-                        raise FileNotFoundError(f"Background file not found: {background_path}")
+def _get_fonts(quote_size: int, movie_size: int) -> tuple:
+    """
+    Find a system font and load it at the quote and movie title sizes
 
-                    print(f"Background file exists: {background_path}")
-                    # Print file size
-                    file_size = os.path.getsize(background_path)
-                    print(f"Background file size: {file_size} bytes")
+    Args:
+        quote_size: Font size for the quote text
+        movie_size: Font size for the movie title
+
+    Returns:
+        Tuple of (quote_font, movie_font), falling back to the default font
+    """
+    # Try to load a system font if available, otherwise use default
+    try:
+        font_path = _find_font_path()
+        return _load_font(font_path, quote_size), _load_font(font_path, movie_size)
+    except Exception as font_error:
+        log.warning("Font loading error: %s", font_error)
+
+    return _load_font(None, quote_size), _load_font(None, movie_size)
 
-                    # Load the background
-                    bg = Image.open(background_path)
-                    print(f"Background loaded with size: {bg.size}, mode: {bg.mode}")
 
-                    # Resize if needed
-                    if bg.size != (WIDTH, HEIGHT):
-                        bg = bg.resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
+def _wrap_to_width(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> List[str]:
+    """
+    Greedily wrap text into lines no wider than max_width pixels
+
+    Args:
+        draw: Drawing object used to measure text
+        text: Text to wrap
+        font: Font the text will be rendered with
+        max_width: Maximum line width in pixels
 
-                    # Add a semi-transparent black overlay for readability
-                    if bg.mode != 'RGBA':
-                        bg = bg.convert('RGBA')
+    Returns:
+        List of wrapped lines (a single overlong word gets a line of its own)
+    """
+    lines = []
+    current_line = ""
+    for word in text.split():
+        candidate = f"{current_line} {word}" if current_line else word
+        if not current_line or draw.textbbox((0, 0), candidate, font=font)[2] <= max_width:
+            current_line = candidate
+        else:
+            lines.append(current_line)
+            current_line = word
 
-                    overlay = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 100))
-                    img = Image.alpha_composite(bg, overlay).convert('RGB')
+    if current_line:
+        lines.append(current_line)
+    return lines
 
-                    print("Background processed successfully")
 
-                except Exception as bg_error:
-                    print(f"Background error: {bg_error}. Using plain black background.")
-                    img = Image.new('RGB', (WIDTH, HEIGHT), color=(0, 0, 0))
+def _make_frame(index: int, background: np.ndarray, quote: str) -> np.ndarray:
+    """
+    Create a single frame with large text on its gradient background
 
-            # Create a drawing object
-            draw = ImageDraw.Draw(img)
+    Args:
+        index: Quote index, used for progress output
+        background: RGB array of the background image
+        quote: The horror movie quote
 
-            # Try to load a system font if available, otherwise use default
+    Returns:
+        (HEIGHT, WIDTH, 3) uint8 RGB array of the frame with text
+    """
+    log.info("Creating frame %s...", index + 1)
+
+    try:
+        # Split quote into quote text and movie title
+        parts = quote.split(' - ')
+        quote_text = parts[0].strip()
+        movie_title = parts[1].strip() if len(parts) > 1 else "Unknown"
+
+        # Remove leading numbers from quote (e.g., "1. " or "1) ")
+        quote_text = _LEADING_NUMBER.sub('', quote_text)
+
+        # SANITY CHECK - create a solid color background instead of using the gradient
+        # This is to see if the issue is with loading the gradient or with something else
+        bg_type = "gradient"  # "gradient" to use the gradient, "solid" to use a solid color
+
+        if bg_type == "solid":
+            # Create a solid color background (for testing)
+            colors = [(120, 0, 0), (0, 0, 120), (0, 120, 0), (120, 0, 120), (0, 120, 120)]
+            frame = np.full((HEIGHT, WIDTH, 3), colors[index % len(colors)], dtype=np.uint8)
+            log.debug("Created solid color background: %s", colors[index % len(colors)])
+        else:
+            # Use the gradient background
             try:
-                # Try to find a system font
-                system_fonts = [
-                    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
-                    '/usr/share/fonts/truetype/ubuntu/Ubuntu-B.ttf',
-                    '/Library/Fonts/Arial Bold.ttf',
-                    '/Library/Fonts/Helvetica.ttc',
-                    'C:\\Windows\\Fonts\\arialbd.ttf',
-                    'C:\\Windows\\Fonts\\segoeui.ttf'
-                ]
+                log.debug("Background received with shape: %s", background.shape)
+
+                # Resize if needed (round-tripping through PIL only in that case)
+                if background.shape != (HEIGHT, WIDTH, 3):
+                    bg = Image.fromarray(background).convert('RGB')
+                    background = np.asarray(bg.resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS))
+
+                # Darken as if a black overlay at alpha 100 were composited on top,
+                # which is a single integer multiply by (255 - 100) / 255
+                frame = (background.astype(np.uint16) * 155 // 255).astype(np.uint8)
+
+                log.debug("Background processed successfully")
+
+            except Exception as bg_error:
+                log.warning("Background error: %s. Using plain black background.", bg_error)
+                frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+        # Draw the white text as a single-channel coverage mask and blend it in with NumPy,
+        # rather than rasterizing onto the full RGB frame
+        text_mask = Image.new('L', (WIDTH, HEIGHT), 0)
+        draw = ImageDraw.Draw(text_mask)
+
+        # Load fonts once per process and reuse them for every frame
+        quote_font, movie_font = _get_fonts(QUOTE_FONT_SIZE, MOVIE_FONT_SIZE)
+
+        # Break the quote into lines that fit the frame, measured in pixels
+        # Keep lines shorter than the full width for better readability
+        lines = _wrap_to_width(draw, quote_text, quote_font, WIDTH - 200)
+
+        # Write the quote as one centered block of white text
+        draw.multiline_text((WIDTH // 2, HEIGHT // 4), "\n".join(lines),
+                            fill=255, font=quote_font,
+                            anchor="ma", align="center", spacing=40)
+
+        # Write movie title
+        y = HEIGHT * 3 // 4
+        movie_text = f"- {movie_title}"
+        text_width = (draw.textlength(movie_text, font=movie_font)
+                      if hasattr(draw, 'textlength') else len(movie_text) * 24)
+        x = (WIDTH - text_width) // 2
+
+        # Draw movie title
+        draw.text((x, y), movie_text, fill=255, font=movie_font)
+
+        # Blend white over the background only at pixels the glyphs actually cover
+        bbox = text_mask.getbbox()
+        if bbox:
+            left, top, right, bottom = bbox
+            coverage = np.asarray(text_mask.crop(bbox))
+            ys, xs = np.nonzero(coverage)
+            alpha = coverage[ys, xs, None] * np.float32(1 / 255)
+            region = frame[top:bottom, left:right]
+            region[ys, xs] = region[ys, xs] * (1 - alpha) + 255 * alpha
+
+        log.info("✓ Created frame %s", index + 1)
+        # Frames are piped to FFmpeg as raw pixels, so there's no need to save them
+        return frame
 
-                quote_font = None
-                movie_font = None
-
-                for font_path in system_fonts:
-                    if os.path.exists(font_path):
-                        quote_font = ImageFont.truetype(font_path, 60)  # Very large font for quotes
-                        movie_font = ImageFont.truetype(font_path, 48)  # Large font for movie title
-                        print(f"Using system font: {font_path}")
-                        break
-
-                if not quote_font:
-                    # Fall back to default font
-                    quote_font = ImageFont.load_default()
-                    movie_font = ImageFont.load_default()
-                    print("Using default font")
-            except Exception as font_error:
-                print(f"Font loading error: {font_error}")
-                quote_font = ImageFont.load_default()
-                movie_font = ImageFont.load_default()
-
-            # Break the quote into lines
-            words = quote_text.split()
-            lines = []
-            current_line = []
-
-            # Keep lines shorter for better readability
-            max_chars_per_line = 25
-
-            for word in words:
-                if len(' '.join(current_line + [word])) <= max_chars_per_line:
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                    else:
-                        lines.append(word)
+    except Exception as e:
+        log.error("Error creating frame %s: %s", index + 1, e)
+        log.debug("Exception details: %s: %s", type(e).__name__, str(e))
+        # Create a simple error frame
+        error_img = Image.new('RGB', (WIDTH, HEIGHT), color="black")
+        error_draw = ImageDraw.Draw(error_img)
+        error_draw.text((WIDTH//2, HEIGHT//2), f"Error: {str(e)}", fill="white")
+        return np.asarray(error_img)
+
+
+def _warm_render_caches(n_quotes: int) -> None:
+    """
+    Build the palette gradients and fonts the render workers will need
+
+    Args:
+        n_quotes: Number of quotes being rendered, which decides the palettes used
+    """
+    for color1, color2 in COLOR_PAIRS[:n_quotes]:
+        _make_gradient(color1, color2)
+    _get_fonts(QUOTE_FONT_SIZE, MOVIE_FONT_SIZE)
 
-            if current_line:
-                lines.append(' '.join(current_line))
 
-            # Write each line of the quote
-            y = HEIGHT // 4
-            for line in lines:
-                # Draw white text on background
-                text_width = (draw.textlength(line, font=quote_font)
-                              if hasattr(draw, 'textlength') else len(line) * 30)
-                x = (WIDTH - text_width) // 2
+def _render_pool(n_tasks: int) -> ProcessPoolExecutor:
+    """
+    Create the process pool used to render backgrounds and frames
+
+    Args:
+        n_tasks: Number of independent render tasks (one per quote)
 
-                # Single draw with large font
-                draw.text((x, y), line, fill=(255, 255, 255), font=quote_font)
+    Returns:
+        Process pool sized to the work, forking its workers on Linux
+    """
+    # On Linux, forked workers inherit the imported modules and the caches main already
+    # warmed. Elsewhere keep the platform default (macOS uses spawn because forking after
+    # system frameworks start threads can crash the child); each worker then warms its
+    # own caches once in the initializer, which is a cache hit for forked workers
+    context = None
+    if sys.platform.startswith("linux"):
+        context = multiprocessing.get_context("fork")
+    workers = max(1, min(os.cpu_count() or 1, n_tasks))
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_warm_render_caches, initargs=(n_tasks,))
+
+
+def create_frames_with_text(backgrounds: List[np.ndarray], quotes: List[str],
+                            executor: Optional[Executor] = None) -> List[np.ndarray]:
+    """
+    Create frames with large text on gradient backgrounds
 
-                y += 100  # Large line spacing
+    Args:
+        backgrounds: Background image arrays
+        quotes: List of quotes
+        executor: Optional executor to render frames in parallel
 
-            # Write movie title
-            y = HEIGHT * 3 // 4
-            movie_text = f"- {movie_title}"
-            text_width = (draw.textlength(movie_text, font=movie_font)
-                          if hasattr(draw, 'textlength') else len(movie_text) * 24)
-            x = (WIDTH - text_width) // 2
+    Returns:
+        List of RGB frame arrays with text
+    """
+    log.info("Creating frames with large text on gradient backgrounds...")
 
-            # Draw movie title
-            draw.text((x, y), movie_text, fill=(255, 255, 255), font=movie_font)
+    map_fn = executor.map if executor else map
+    return list(map_fn(_make_frame, range(len(quotes)), backgrounds, quotes))
 
-            # Save the image
-            img.save(frame_path)
-            frame_paths.append(frame_path)
 
-            print(f"✓ Created frame {i+1}")
+def _ffmpeg_threads() -> Optional[int]:
+    """
+    Read the FFmpeg encoder thread cap from HORRORVIBES_FFMPEG_THREADS
 
-        except Exception as e:
-            print(f"Error creating frame {i+1}: {e}")
-            print(f"Exception details: {type(e).__name__}: {str(e)}")
-            # Create a simple error frame
-            frame_path = FRAMES_DIR / f"frame_{i + 1}.png"
-            error_img = Image.new('RGB', (WIDTH, HEIGHT), color="black")
-            error_draw = ImageDraw.Draw(error_img)
-            error_draw.text((WIDTH//2, HEIGHT//2), f"Error: {str(e)}", fill="white")
-            error_img.save(frame_path)
-            frame_paths.append(frame_path)
+    Returns:
+        Threads for the libx264 encode, or None to leave it to x264's own default
+    """
+    override = os.getenv("HORRORVIBES_FFMPEG_THREADS")
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            log.warning("Ignoring invalid HORRORVIBES_FFMPEG_THREADS value: %s", override)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _pick_encoder() -> str:
+    """
+    Choose the fastest working H.264 encoder, probing FFmpeg once per process
+
+    Returns:
+        Encoder name from VIDEO_ENCODERS (HORRORVIBES_ENCODER overrides, libx264 fallback)
+    """
+    override = os.getenv("HORRORVIBES_ENCODER")
+    if override:
+        if override in VIDEO_ENCODERS:
+            return override
+        log.warning("Ignoring unknown HORRORVIBES_ENCODER value: %s", override)
+
+    try:
+        listing = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                 capture_output=True, text=True, check=False).stdout
+    except OSError as e:
+        log.debug("Could not list FFmpeg encoders: %s", e)
+        return 'libx264'
+
+    for encoder in VIDEO_ENCODERS:
+        if encoder == 'libx264' or f" {encoder} " not in listing:
+            continue
+        # Builds often list hardware encoders the machine can't drive, so try a tiny encode
+        probe = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-v', 'error', '-f', 'lavfi',
+             '-i', 'color=black:s=256x256:d=0.1',
+             '-c:v', encoder, '-pix_fmt', 'yuv420p', '-f', 'null', '-'],
+            capture_output=True, check=False)
+        if probe.returncode == 0:
+            log.info("Using hardware video encoder: %s", encoder)
+            return encoder
+        log.debug("Encoder %s is listed but unusable here", encoder)
 
-    return frame_paths
+    return 'libx264'
+
+
+def _run_ffmpeg(cmd: List[str], frames: List[np.ndarray]) -> subprocess.CompletedProcess:
+    """
+    Run FFmpeg while streaming raw RGB frames to its stdin
 
+    Args:
+        cmd: FFmpeg command reading rawvideo from pipe:0
+        frames: Frame arrays to write, in order
 
-def create_video(frame_paths: List[Path], output_path: Path, music_path: Optional[Path] = None,
+    Returns:
+        Completed process with the return code and stderr output
+    """
+    # Collect stderr in a temporary file rather than a pipe: nothing reads a pipe while
+    # frames are being written, so a chatty FFmpeg could fill it and deadlock both sides
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                              stderr=stderr_file) as proc:
+            try:
+                for frame in frames:
+                    proc.stdin.write(memoryview(np.ascontiguousarray(frame, dtype=np.uint8)))
+            except BrokenPipeError:
+                # FFmpeg exited early; its stderr explains why
+                pass
+            finally:
+                proc.stdin.close()
+            proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode('utf-8', errors='replace')
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, stderr)
+
+
+def create_video(frames: List[np.ndarray], output_path: Path, music_path: Optional[Path] = None,
                  duration_per_frame: int = 10) -> Path:
     """
-    Combine frames into a video using FFmpeg directly with separate audio handling
+    Combine frames and audio into a video with a single FFmpeg invocation
 
     Args:
-        frame_paths: List of paths to the frames with text
+        frames: List of RGB frame arrays with text, piped to FFmpeg as raw video
         output_path: Path for the output video
         music_path: Optional path to background music
         duration_per_frame: Duration in seconds for each frame
@@ -467,165 +810,201 @@ def create_video(frame_paths: List[Path], output_path: Path, music_path: Optiona
     Returns:
         Path to the created video
     """
-    print("\n" + "="*50)
-    print("VIDEO CREATION WITH CUSTOM AUDIO")
-    print("="*50)
+    log.info("="*50)
+    log.info("VIDEO CREATION WITH CUSTOM AUDIO")
+    log.info("="*50)
 
     try:
         # Convert all paths to absolute paths to avoid FFmpeg path issues
-        abs_frame_paths = [os.path.abspath(str(path)) for path in frame_paths]
         abs_output_path = os.path.abspath(str(output_path))
         abs_music_path = os.path.abspath(str(music_path)) if music_path else None
 
-        # Create a temp dir for intermediate files
-        temp_dir = tempfile.mkdtemp()
-        print(f"Created temp directory: {temp_dir}")
-
-        print(f"Creating video with {len(frame_paths)} frames, duration: {duration_per_frame}s each")
-        print(f"Output will be saved to: {abs_output_path}")
+        log.info("Creating video with %s frames, duration: %ss each", len(frames), duration_per_frame)
+        log.info("Output will be saved to: %s", abs_output_path)
 
         # Debug music path
         has_valid_audio = False
         if music_path and os.path.exists(abs_music_path):
             file_size = os.path.getsize(abs_music_path)
-            print(f"Music file exists, size: {file_size} bytes")
+            log.debug("Music file exists, size: %s bytes", file_size)
 
             # Try to check if it's a valid audio file
             try:
-                audio_check_cmd = ['ffprobe', '-v', 'error', '-i', abs_music_path]
-                check_result = subprocess.run(audio_check_cmd, capture_output=True,
-                                              text=True, check=False)
-                if check_result.returncode == 0:
-                    print("Audio file validation successful!")
-                    has_valid_audio = True
-                else:
-                    print(f"Audio validation failed: {check_result.stderr}")
+                has_valid_audio = _is_audio(abs_music_path)
+                if has_valid_audio:
+                    log.debug("Audio file validation successful!")
             except Exception as check_error:
-                print(f"Error checking audio file: {check_error}")
+                log.warning("Error checking audio file: %s", check_error)
         else:
-            print("No valid music path provided")
-
-        # STEP 1: Create a silent video from frames
-        print("\nStep 1: Creating silent video from frames...")
-
-        # Create a temporary text file with frame information for ffmpeg
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            frame_list_path = f.name
-            # Write each frame with its duration using absolute paths
-            for frame_path in abs_frame_paths:
-                f.write(f"file '{frame_path}'\n")
-                f.write(f"duration {duration_per_frame}\n")
-            # Write the last frame again without duration (required by ffmpeg)
-            if abs_frame_paths:
-                f.write(f"file '{abs_frame_paths[-1]}'\n")
-
-        silent_video_path = os.path.join(temp_dir, "silent_video.mp4")
-
-        # Basic FFmpeg command for silent video
-        silent_cmd = [
-            'ffmpeg',
-            '-y',                   # Overwrite output file if it exists
-            '-f', 'concat',         # Use concat demuxer
-            '-safe', '0',           # Don't check for relative paths
-            '-i', frame_list_path,  # Input file list
-            '-c:v', 'libx264',      # Video codec
-            '-pix_fmt', 'yuv420p',  # Pixel format for compatibility
-            '-preset', 'medium',    # Encoding speed/compression tradeoff
-            '-crf', '23',           # Quality (lower is better)
-            '-r', '30',             # Output frame rate
-            silent_video_path
-        ]
-
-        print(f"Running command: {' '.join(silent_cmd)}")
-
-        silent_result = subprocess.run(silent_cmd, capture_output=True, text=True, check=False)
-        if silent_result.returncode != 0:
-            print(f"Error creating silent video: {silent_result.stderr}")
-            raise Exception("Failed to create silent video")
-
-        print(f"Silent video created: {silent_video_path}")
-
-        # STEP 2: Add audio if available
-        final_video_path = abs_output_path
-
-        if has_valid_audio:
-            print("\nStep 2: Adding custom audio to video...")
+            log.info("No valid music path provided")
 
-            # FFmpeg command to add audio
-            audio_cmd = [
+        # Single FFmpeg pass: encode the frames and mux the audio in together
+        threads = _ffmpeg_threads()
+        encoder = _pick_encoder()
+        def build_video_cmd(with_audio: bool) -> List[str]:
+            cmd = [
                 'ffmpeg',
-                '-y',                      # Overwrite output file if it exists
-                '-i', silent_video_path,   # Input video
-                '-i', abs_music_path,      # Input audio
-                '-c:v', 'copy',            # Copy video without re-encoding
-                '-c:a', 'aac',             # Audio codec
-                '-b:a', '192k',            # Audio bitrate
-                '-shortest',               # End when shortest input ends
-                final_video_path
+                '-y',                   # Overwrite output file if it exists
+                '-nostats',             # Keep stderr small while frames stream in
+                '-f', 'rawvideo',       # Raw frames from stdin, no PNG round-trip
+                '-pix_fmt', 'rgb24',
+                '-s', f'{WIDTH}x{HEIGHT}',
+                '-framerate', f'1/{duration_per_frame}',  # Each frame holds for its duration
+                '-i', 'pipe:0',
+            ]
+            if with_audio:
+                cmd += ['-i', abs_music_path]  # Input audio
+            cmd += ['-c:v', encoder, *VIDEO_ENCODERS[encoder]]  # Video codec and quality
+            if encoder == 'libx264' and threads:
+                cmd += ['-threads', str(threads)]  # Only when capped through the environment
+            cmd += [
+                '-pix_fmt', 'yuv420p',  # Pixel format for compatibility
+                '-bf', '0',             # No B-frames; the picture only changes between quotes
+                '-g', '30',             # One keyframe per second
+                '-r', '30',             # Output frame rate
             ]
+            if with_audio:
+                cmd += [
+                    '-c:a', 'aac',      # Audio codec
+                    '-b:a', '192k',     # Audio bitrate
+                    '-shortest',        # End when shortest input ends
+                ]
+            return cmd + [abs_output_path]
 
-            print(f"Running command: {' '.join(audio_cmd)}")
+        if has_valid_audio:
+            log.info("Encoding video with custom audio...")
+        else:
+            log.info("No valid audio - encoding silent video...")
 
-            audio_result = subprocess.run(audio_cmd, capture_output=True, text=True, check=False)
-            if audio_result.returncode != 0:
-                print(f"Error adding audio: {audio_result.stderr}")
-                # If audio fails, just use the silent video
-                print("Using silent video as fallback")
-                final_video_path = silent_video_path
-            else:
-                print("Audio added successfully!")
+        video_cmd = build_video_cmd(has_valid_audio)
+        log.debug("Running command: %s", ' '.join(video_cmd))
+        video_result = _run_ffmpeg(video_cmd, frames)
 
-                # Verify the output video has audio
-                try:
-                    verify_cmd = [
-                        'ffprobe',
-                        '-v', 'error',
-                        '-select_streams', 'a:0',
-                        '-show_entries', 'stream=codec_type',
-                        '-of', 'csv=p=0',
-                        final_video_path
-                    ]
-                    verify_result = subprocess.run(verify_cmd, capture_output=True,
-                                                   text=True, check=False)
-                    if 'audio' in verify_result.stdout:
-                        print("✓ Output video contains audio!")
-                    else:
-                        print("WARNING: Output video does not contain audio!")
-                except Exception as verify_err:
-                    print(f"Error verifying audio: {verify_err}")
-        else:
-            print("\nStep 2: No valid audio - using silent video")
-            final_video_path = silent_video_path
+        if video_result.returncode != 0 and has_valid_audio:
+            log.warning("Error adding audio: %s", video_result.stderr)
+            # If audio fails, fall back to a silent video
+            log.warning("Retrying without audio as fallback")
+            has_valid_audio = False
+            video_cmd = build_video_cmd(False)
+            log.debug("Running command: %s", ' '.join(video_cmd))
+            video_result = _run_ffmpeg(video_cmd, frames)
 
-        # STEP 3: Copy the result to the desired output location if needed
-        if final_video_path != abs_output_path:
-            print(f"\nStep 3: Copying video to final destination: {abs_output_path}")
-            shutil.copy2(final_video_path, abs_output_path)
+        if video_result.returncode != 0:
+            log.error("Error creating video: %s", video_result.stderr)
+            raise Exception("Failed to create video")
 
-        # Clean up temporary files
-        try:
-            shutil.rmtree(temp_dir)
-            os.unlink(frame_list_path)
-            print("Temporary files cleaned up")
-        except Exception as clean_error:
-            print(f"Error cleaning up temp files: {clean_error}")
+        if has_valid_audio:
+            log.info("Audio added successfully!")
+
+            # Verify the output video has audio
+            try:
+                verify_cmd = [
+                    'ffprobe',
+                    '-v', 'error',
+                    '-select_streams', 'a:0',
+                    '-show_entries', 'stream=codec_type',
+                    '-of', 'csv=p=0',
+                    abs_output_path
+                ]
+                verify_result = subprocess.run(verify_cmd, capture_output=True,
+                                               text=True, check=False)
+                if 'audio' in verify_result.stdout:
+                    log.info("✓ Output video contains audio!")
+                else:
+                    log.warning("WARNING: Output video does not contain audio!")
+            except Exception as verify_err:
+                log.warning("Error verifying audio: %s", verify_err)
 
         # Final verification
         if os.path.exists(abs_output_path):
             file_size = os.path.getsize(abs_output_path)
-            print(f"\n✓ Final video created at {abs_output_path}, size: {file_size} bytes")
+            log.info("✓ Final video created at %s, size: %s bytes", abs_output_path, file_size)
             return output_path
 
-        print(f"ERROR: Final video not found at {abs_output_path}")
+        log.error("ERROR: Final video not found at %s", abs_output_path)
         raise Exception("Final video not created")
 
     except Exception as e:
-        print(f"ERROR: Failed to create video: {e}")
-        import traceback
-        print(f"Stack trace: {traceback.format_exc()}")
+        log.exception("ERROR: Failed to create video: %s", e)
         sys.exit(1)
     finally:
-        print("="*50 + "\n")
+        log.info("="*50)
+
+
+def _is_audio(path) -> bool:
+    """
+    Check that a file looks like audio, sniffing its header before falling back to ffprobe
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        True if the file is a recognized or ffprobe-readable audio file
+    """
+    with open(path, 'rb') as f:
+        head = f.read(12)
+
+    known_headers = (
+        head[:3] == b'ID3',                                       # MP3 with ID3 tag
+        len(head) >= 2 and head[0] == 0xFF and head[1] >= 0xE0,  # Bare MPEG audio frame
+        head[:4] == b'RIFF' and head[8:12] == b'WAVE',            # WAV
+        head[:4] == b'fLaC',                                      # FLAC
+        head[4:8] == b'ftyp',                                     # MP4/M4A container
+    )
+    if any(known_headers):
+        return True
+
+    # Unrecognized header, so let ffprobe decide
+    audio_check_cmd = ['ffprobe', '-v', 'error', '-i', str(path)]
+    check_result = subprocess.run(audio_check_cmd, capture_output=True, text=True, check=False)
+    if check_result.returncode != 0:
+        log.warning("Audio validation failed: %s", check_result.stderr)
+        return False
+    return True
+
+
+def _scan_audio_dir() -> List[Path]:
+    """
+    List valid audio files in the audio directory, validating only new or changed files
+
+    Returns:
+        Paths of audio files that passed validation
+    """
+    try:
+        with open(AUDIO_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    scanned = {}
+    with os.scandir(AUDIO_DIR) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith(AUDIO_EXTENSIONS) or not entry.is_file():
+                continue
+            stat = entry.stat()
+            cached = manifest.get(entry.name)
+            if (isinstance(cached, dict) and cached.get('mtime') == stat.st_mtime_ns
+                    and cached.get('size') == stat.st_size):
+                scanned[entry.name] = cached
+                continue
+
+            try:
+                valid = _is_audio(entry.path)
+            except Exception as e:
+                log.warning("Error checking audio file %s: %s", entry.name, e)
+                valid = False
+            log.debug("Validated %s (%s bytes): %s", entry.name, stat.st_size, valid)
+            scanned[entry.name] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'valid': valid}
+
+    # Rewrite the manifest only when files were added, changed, or removed
+    if scanned != manifest:
+        try:
+            with open(AUDIO_MANIFEST, 'w', encoding='utf-8') as f:
+                json.dump(scanned, f, indent=2)
+        except OSError as e:
+            log.warning("Could not write audio manifest: %s", e)
+
+    return [AUDIO_DIR / name for name, info in scanned.items() if info.get('valid')]
 
 
 def get_custom_audio() -> Optional[Path]:
@@ -635,54 +1014,39 @@ def get_custom_audio() -> Optional[Path]:
     Returns:
         Path to a custom audio file or None if not found
     """
-    print("\nLooking for custom audio files in the audio directory...")
-
-    # Create the audio directory if it doesn't exist
-    AUDIO_DIR.mkdir(exist_ok=True)
+    log.info("Looking for custom audio files in the audio directory...")
 
     # Check if there are any audio files in the directory
-    audio_files = (list(AUDIO_DIR.glob('*.mp3')) + list(AUDIO_DIR.glob('*.wav')) +
-                   list(AUDIO_DIR.glob('*.m4a')))
+    audio_files = _scan_audio_dir()
 
     if not audio_files:
-        print("No custom audio files found in the audio directory.")
-        print(f"Please place your MP3, WAV, or M4A files in the {AUDIO_DIR} directory.")
+        log.warning("No custom audio files found in the audio directory.")
+        log.warning("Please place your MP3, WAV, or M4A files in the %s directory.", AUDIO_DIR)
         return None
 
-    # If there are multiple files, select one randomly or the first one
+    # If there are multiple files, select one randomly
     selected_audio = random.choice(audio_files)
-    print(f"Selected audio file: {selected_audio}")
-
-    # Verify the audio file
-    try:
-        file_size = os.path.getsize(selected_audio)
-        print(f"Audio file size: {file_size} bytes")
-
-        # Check if it's a valid audio file
-        audio_check_cmd = ['ffprobe', '-v', 'error', '-i', str(selected_audio)]
-        check_result = subprocess.run(audio_check_cmd, capture_output=True, text=True, check=False)
-        if check_result.returncode == 0:
-            print("✓ Audio file validation successful")
-            return selected_audio
-        print(f"Audio validation failed: {check_result.stderr}")
-        return None
-    except Exception as e:
-        print(f"Error checking audio file: {e}")
-        return None
+    log.info("Selected audio file: %s", selected_audio)
+    return selected_audio
 
 
-def get_youtube_credentials() -> Credentials:
+def get_youtube_credentials(interactive: bool = True) -> Optional[Credentials]:
     """
     Get or refresh YouTube API credentials
 
+    Args:
+        interactive: Whether to fall back to the browser sign-in when token.json is
+            missing or can't be refreshed
+
     Returns:
-        Google credentials for YouTube API
+        Google credentials for YouTube API, or None if they need a browser sign-in
+        and interactive is False
     """
     # YouTube API OAuth 2.0 scopes
     scopes = ['https://www.googleapis.com/auth/youtube.upload']
 
     creds = None
-    token_path = Path('token.json')
+    token_path = BASE_DIR / 'token.json'
 
     # Check if token.json exists
     if token_path.exists():
@@ -703,12 +1067,16 @@ def get_youtube_credentials() -> Credentials:
 
         # If still no valid credentials, need to go through OAuth flow
         if not creds:
-            client_secrets_path = Path('client_secret.json')
+            if not interactive:
+                return None
+
+            client_secrets_path = BASE_DIR / 'client_secret.json'
 
             if not client_secrets_path.exists():
-                print("Error: client_secret.json not found.")
-                print("Download it from Google Cloud Console and save it as client_secret.json")
-                sys.exit(1)
+                # Raise rather than exit, since this runs on a worker thread
+                raise FileNotFoundError(
+                    "client_secret.json not found. Download it from Google Cloud Console "
+                    "and save it as client_secret.json")
 
             flow = InstalledAppFlow.from_client_secrets_file(
                 str(client_secrets_path), scopes)
@@ -721,7 +1089,33 @@ def get_youtube_credentials() -> Credentials:
     return creds
 
 
-def upload_to_youtube(video_path: Path, title: str, description: str, tags: List[str]) -> str:
+@lru_cache(maxsize=1)
+def get_youtube_service():
+    """
+    Build the YouTube API service once per process
+
+    Returns:
+        YouTube Data API v3 resource whose authorized HTTP connection is kept alive
+    """
+    return build('youtube', 'v3', credentials=get_youtube_credentials(), cache_discovery=False)
+
+
+def prefetch_youtube_service() -> bool:
+    """
+    Build the YouTube API service ahead of the upload, if it needs no browser sign-in
+
+    Returns:
+        True if the service is ready, False if the upload still has to sign in
+    """
+    # Only token.json and its refresh here; the browser sign-in waits for the upload
+    if get_youtube_credentials(interactive=False) is None:
+        return False
+    get_youtube_service()
+    return True
+
+
+def upload_to_youtube(video_path: Path, title: str, description: str, tags: List[str],
+                      chunksize: int = UPLOAD_CHUNK_SIZE) -> str:
     """
     Upload video to YouTube as a Short
 
@@ -730,18 +1124,16 @@ def upload_to_youtube(video_path: Path, title: str, description: str, tags: List
         title: Video title
         description: Video description
         tags: List of tags
+        chunksize: Resumable upload chunk size in bytes, or 0 to send the file in one request
 
     Returns:
         YouTube video ID
     """
-    print("Preparing to upload to YouTube...")
+    log.info("Preparing to upload to YouTube...")
 
     try:
-        # Get credentials
-        creds = get_youtube_credentials()
-
-        # Build YouTube API service
-        youtube = build('youtube', 'v3', credentials=creds)
+        # Build YouTube API service (cached, so retries reuse its connection)
+        youtube = get_youtube_service()
 
         # Prepare video metadata
         body = {
@@ -757,33 +1149,75 @@ def upload_to_youtube(video_path: Path, title: str, description: str, tags: List
             }
         }
 
+        # Resumable chunks must be a multiple of 256 KB; -1 sends the whole file at once
+        if chunksize > 0:
+            chunksize = max(1, chunksize // UPLOAD_CHUNK_ALIGN) * UPLOAD_CHUNK_ALIGN
+        else:
+            chunksize = -1
+
         # Upload video
-        print("Uploading video to YouTube (this may take a while)...")
-        media = MediaFileUpload(
-            str(video_path),
-            mimetype='video/mp4',
-            resumable=True
-        )
+        log.info("Uploading video to YouTube (this may take a while)...")
+        # Map the file so each chunk is paged in on demand rather than copied through
+        # a read buffer first
+        with open(video_path, 'rb') as video_file, \
+                mmap.mmap(video_file.fileno(), 0, access=mmap.ACCESS_READ) as video_map:
+            # The file is read front to back, so let the kernel read ahead aggressively
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                video_map.madvise(mmap.MADV_SEQUENTIAL)
+
+            media = MediaIoBaseUpload(
+                video_map,
+                mimetype='video/mp4',
+                chunksize=chunksize,
+                resumable=True
+            )
 
-        request = youtube.videos().insert(
-            part='snippet,status',
-            body=body,
-            media_body=media
-        )
+            request = youtube.videos().insert(
+                part='snippet,status',
+                body=body,
+                media_body=media
+            )
+
+            # Retry transient failures per chunk; the session resumes from the last
+            # byte the server acknowledged instead of starting over
+            response = None
+            backoff = 1
+            retries = 0
+            last_progress = 0.0
+            while response is None:
+                try:
+                    status, response = request.next_chunk()
+                except (HttpError, OSError, httplib2.HttpLib2Error) as e:
+                    transient = (not isinstance(e, HttpError)
+                                 or e.resp.status in UPLOAD_RETRY_STATUSES)
+                    if not transient or retries >= UPLOAD_MAX_RETRIES:
+                        raise
+                    retries += 1
+                    log.warning("Upload chunk failed (%s), retrying in %ss...", e, backoff)
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, UPLOAD_MAX_BACKOFF)
+                    continue
+
+                backoff = 1
+                retries = 0
+                # Throttle progress output so small chunks don't flood the log
+                now = time.monotonic()
+                if status and now - last_progress >= UPLOAD_PROGRESS_INTERVAL:
+                    last_progress = now
+                    log.info("Uploaded %d%%", int(status.progress() * 100))
 
-        response = request.execute()
         video_id = response['id']
 
-        print(f"✓ Video uploaded to YouTube: https://www.youtube.com/watch?v={video_id}")
+        log.info("✓ Video uploaded to YouTube: https://www.youtube.com/watch?v=%s", video_id)
         return video_id
 
     except HttpError as e:
-        print(f"YouTube API error: {e.reason}")
-        print("Check your credentials and try again.")
+        log.error("YouTube API error: %s", e.reason)
+        log.error("Check your credentials and try again.")
         sys.exit(1)
 
     except Exception as e:
-        print(f"Error uploading to YouTube: {e}")
+        log.error("Error uploading to YouTube: %s", e)
         sys.exit(1)
 
 
@@ -796,75 +1230,120 @@ async def main():
     parser.add_argument('--upload', action='store_true', help='Upload to YouTube when done')
     parser.add_argument('--custom-audio', action='store_true', help='Use custom audio from the audio directory', default=True)
     parser.add_argument('--audio-file', type=str, help='Specific audio file to use (place in audio directory)')
+    parser.add_argument('--reuse-quotes', action='store_true',
+                        help='Re-render with the quotes from the last run instead of requesting new ones')
+    parser.add_argument('--yt-chunksize', type=int, default=UPLOAD_CHUNK_SIZE // (1024 * 1024),
+                        help='YouTube upload chunk size in MB, 0 to upload in one request (default: 50)')
     args = parser.parse_args()
 
-    print("=" * 60)
-    print(" HORROR MOVIE QUOTE VIDEO GENERATOR ")
-    print("=" * 60)
+    log.info("=" * 60)
+    log.info(" HORROR MOVIE QUOTE VIDEO GENERATOR ")
+    log.info("=" * 60)
 
-    # Setup directories
-    setup_directories()
+    # Generate quotes over one shared OpenAI client so its connection pool is reused
+    async with openai.AsyncOpenAI(api_key=openai_api_key) as client:
+        quotes = await get_horror_movie_quotes(args.quotes, client=client,
+                                               reuse=args.reuse_quotes)
 
-    # Generate quotes
-    quotes = get_horror_movie_quotes(args.quotes)
+    # Build each palette's gradient and parse the fonts once up front; forked workers
+    # inherit them read-only
+    _warm_render_caches(len(quotes))
 
-    # Generate background images
-    background_paths = []
-    for i, quote in enumerate(quotes):
-        background_path = generate_background_image(quote, i)
-        print(f"Generated background at: {background_path}, exists: {os.path.exists(background_path)}")
-        background_paths.append(background_path)
+    # Backgrounds and frames are independent per quote, so render them across processes
+    with _render_pool(len(quotes)) as executor:
+        # Generate background images; awaiting the pool keeps the event loop free
+        # for other tasks, and gather preserves quote order
+        loop = asyncio.get_running_loop()
+        backgrounds = await asyncio.gather(
+            *(loop.run_in_executor(executor, generate_background_image, quote, i)
+              for i, quote in enumerate(quotes)))
+        log.info("Generated %s backgrounds", len(backgrounds))
 
-    # Create frames with text using the background images
-    frame_paths = create_frames_with_text(background_paths, quotes)
+        # Create frames with text using the background images
+        frames = create_frames_with_text(backgrounds, quotes, executor)
 
     # Check for custom audio
     music_path = None
     if args.audio_file:
         # Use specific audio file if provided
         specific_file = AUDIO_DIR / args.audio_file
-        if os.path.exists(specific_file):
+        if specific_file.exists():
             music_path = specific_file
-            print(f"Using specified audio file: {music_path}")
+            log.info("Using specified audio file: %s", music_path)
         else:
-            print(f"Specified audio file not found: {args.audio_file}")
-            print(f"Please place the file in the {AUDIO_DIR} directory.")
+            log.warning("Specified audio file not found: %s", args.audio_file)
+            log.warning("Please place the file in the %s directory.", AUDIO_DIR)
     elif args.custom_audio:
         # Use any available custom audio
         music_path = get_custom_audio()
         if not music_path:
-            print("No custom audio files found. Please add MP3, WAV, or M4A files to the audio directory.")
+            log.warning("No custom audio files found. Please add MP3, WAV, or M4A files to the audio directory.")
 
     # Generate timestamp for unique filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = OUTPUT_DIR / f"horror_quotes_{timestamp}.mp4"
 
-    # Create video
-    video_path = create_video(
-        frame_paths,
-        output_path,
-        music_path,
-        duration_per_frame=args.duration
-    )
+    # Load and refresh the saved YouTube credentials while the video is encoded, so the
+    # upload can start sending bytes as soon as the video is ready. The render pool
+    # has shut down by now, so no worker gets forked while this thread is running.
+    # A first-time browser sign-in is left for the upload, once the video exists
+    youtube_task = None
+    if args.upload:
+        youtube_task = loop.run_in_executor(None, prefetch_youtube_service)
 
-    # Optional: Upload to YouTube
+    # Create video
+    try:
+        video_path = create_video(
+            frames,
+            output_path,
+            music_path,
+            duration_per_frame=args.duration
+        )
+    except BaseException:
+        # Don't leave the credential task pending if video creation bailed out
+        if youtube_task is not None:
+            youtube_task.cancel()
+        raise
+
+    # Optional: Upload to YouTube in a worker thread so the event loop stays free
+    upload_task = None
     if args.upload:
+        # The service is cached once built, so the upload reuses it; otherwise the
+        # upload signs in and builds it, and reports any error itself
         try:
-            upload_to_youtube(
-                video_path,
-                'Haunting Horror Movie Quotes',
-                'A collection of the most spine-chilling quotes from classic horror films',
-                ['horror', 'movie quotes', 'scary', 'horror films', 'shorts']
-            )
+            if not await youtube_task:
+                log.info("YouTube sign-in required, complete it in your browser to upload")
         except Exception as e:
-            print(f"YouTube upload failed: {e}")
-            print(f"Your video is still available locally at: {video_path}")
+            log.warning("Could not prepare YouTube credentials in advance: %s", e)
+        upload_task = loop.run_in_executor(None, partial(
+            upload_to_youtube,
+            video_path,
+            'Haunting Horror Movie Quotes',
+            'A collection of the most spine-chilling quotes from classic horror films',
+            ['horror', 'movie quotes', 'scary', 'horror films', 'shorts'],
+            chunksize=args.yt_chunksize * 1024 * 1024
+        ))
+
+    log.info("=" * 60)
+    log.info("✓ Video saved to: %s", video_path)
+
+    # Only block on the network once all local work is done
+    if upload_task is not None:
+        try:
+            await upload_task
+        except Exception as e:
+            log.warning("YouTube upload failed: %s", e)
+            log.warning("Your video is still available locally at: %s", video_path)
 
-    print("=" * 60)
-    print("✓ Process completed successfully!")
-    print(f"✓ Video saved to: {video_path}")
-    print("=" * 60)
+    log.info("✓ Process completed successfully!")
+    log.info("=" * 60)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when it's installed (it isn't available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())